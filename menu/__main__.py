@@ -1,14 +1,85 @@
 import argparse
 import configparser
 import os
+import re
 import subprocess
 import sys
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 from vtpy import SerialTerminal, Terminal, TerminalException
 
 
+# Pre-rendered escape sequences, so that hot rendering paths can build up an entire
+# frame of output in memory and send it to the terminal in one write.
+ESCAPE = b"\x1B"
+SAVE_CURSOR_B = ESCAPE + Terminal.SAVE_CURSOR
+RESTORE_CURSOR_B = ESCAPE + Terminal.RESTORE_CURSOR
+SET_NORMAL_B = ESCAPE + Terminal.SET_NORMAL
+SET_BOLD_B = ESCAPE + Terminal.SET_BOLD
+CLEAR_LINE_B = ESCAPE + Terminal.CLEAR_LINE
+CLEAR_TO_END_OF_LINE_B = ESCAPE + Terminal.CLEAR_TO_END_OF_LINE
+CLEAR_TO_ORIGIN_B = ESCAPE + Terminal.CLEAR_TO_ORIGIN
+MOVE_CURSOR_ORIGIN_B = ESCAPE + Terminal.MOVE_CURSOR_ORIGIN
+MOVE_CURSOR_UP_B = ESCAPE + Terminal.MOVE_CURSOR_UP
+MOVE_CURSOR_DOWN_B = ESCAPE + Terminal.MOVE_CURSOR_DOWN
+CLEAR_SCROLL_REGION_B = ESCAPE + b"[r"
+SET_AUTO_WRAP_B = ESCAPE + b"[?7h"
+CLEAR_AUTO_WRAP_B = ESCAPE + b"[?7l"
+NEWLINE_B = b"\r\n"
+UNPRINTABLE_B = bytes(range(0x20)) + bytes(range(0x7F, 0x100))
+
+# Insert mode (IRM), which shifts the rest of the line over as characters are written.
+# Only supported on VT-102 and newer terminals.
+SET_INSERT_MODE_B = ESCAPE + b"[4h"
+CLEAR_INSERT_MODE_B = ESCAPE + b"[4l"
+
+# Commonly paired sequences, joined up front.
+SAVE_CURSOR_NORMAL_B = SAVE_CURSOR_B + SET_NORMAL_B
+CLEAR_SCROLL_REGION_RESTORE_CURSOR_B = CLEAR_SCROLL_REGION_B + RESTORE_CURSOR_B
+SET_NORMAL_RESTORE_CURSOR_B = SET_NORMAL_B + RESTORE_CURSOR_B
+
+# Attribute changes that always start from normal text, as a single SGR sequence each.
+SET_NORMAL_BOLD_B = ESCAPE + b"[0;1m"
+SET_NORMAL_REVERSE_B = ESCAPE + b"[0;7m"
+
+
+def moveCursorBytes(row: int, col: int) -> bytes:
+    return ESCAPE + f"[{row};{col}H".encode("ascii")
+
+
+def setScrollRegionBytes(top: int, bottom: int) -> bytes:
+    # Note that we don't enable origin mode here, so cursor movement after setting
+    # a scroll region is still relative to the top left of the screen.
+    return ESCAPE + f"[{top};{bottom}r".encode("ascii")
+
+
+def deleteCharactersBytes(count: int) -> bytes:
+    # Only supported on VT-102 and newer terminals. A count of one is the default.
+    if count == 1:
+        return ESCAPE + b"[P"
+    return ESCAPE + f"[{count}P".encode("ascii")
+
+
+def stripClear(data: bytes) -> bytes:
+    # Drawing a line onto an already blank row doesn't need to wipe anything after it.
+    if data.endswith(CLEAR_TO_END_OF_LINE_B):
+        return data[: -len(CLEAR_TO_END_OF_LINE_B)]
+    return data
+
+
+def sendRaw(terminal: Terminal, data: bytes) -> None:
+    # The terminal only knows how to send text or a single escaped command, but
+    # a command is written out as-is after the escape. So, send any leading text
+    # on its own and then everything from the first escape onward in one go.
+    escapePos = data.find(ESCAPE)
+    if escapePos != 0:
+        text = data if escapePos < 0 else data[:escapePos]
+        terminal.sendText(text.decode("ascii"))
+    if escapePos >= 0:
+        terminal.sendCommand(data[(escapePos + len(ESCAPE)) :])
+
+
 class Action:
     pass
 
@@ -45,6 +116,9 @@ class RendererCore:
     def scrollDown(self) -> None:
         pass
 
+    def scrollBy(self, lines: int) -> None:
+        pass
+
     def pageUp(self) -> None:
         pass
 
@@ -62,317 +136,424 @@ class RendererCore:
 
 
 class TextRendererCore(RendererCore):
+    # The most recently displayed text, wrapped and rendered for each width it was shown at.
+    # This is shared across renderers since the same menu gets redisplayed after every
+    # reconnect, and keeping every width around means flipping between 80 and 132 columns
+    # never re-wraps. Only one text is kept so that this doesn't grow without bound.
+    _wrapCacheText: Optional[str] = None
+    _wrapCache: Dict[int, Tuple[List[str], List[List[Tuple[bool, str]]], List[bytes]]] = {}
+
     def __init__(self, terminal: Terminal, top: int, bottom: int) -> None:
         super().__init__(terminal, top, bottom)
         self.text: List[str] = []
+        self.runs: List[List[Tuple[bool, str]]] = []
+        self.rendered: List[bytes] = []
         self.line: int = 0
+        self.lastLine: int = 0
+        self._outbuf = bytearray()
 
-    def wordWrap(self, text: str) -> str:
-        # Make things easier to deal with.
-        text = text.replace("\r\n", "\n")
-
-        newText: str = ""
-        curLine: str = ""
-
-        def joinLines() -> None:
-            nonlocal newText
-            nonlocal curLine
-
-            if not curLine:
-                return
-
-            if not newText:
-                newText = curLine
-                curLine = ""
-            else:
-                if newText[-1] == "\n":
-                    newText = newText + curLine
-                    curLine = ""
-                else:
-                    newText = newText + "\n" + curLine
-                    curLine = ""
+        # Our viewport never moves, so the sequences that scroll it can be built up front.
+        scrollRegion = setScrollRegionBytes(top, bottom)
+        self._scrollUpB = (
+            SAVE_CURSOR_NORMAL_B + scrollRegion + moveCursorBytes(top, 1) + MOVE_CURSOR_UP_B
+        )
+        self._scrollDownB = (
+            SAVE_CURSOR_NORMAL_B + scrollRegion + moveCursorBytes(bottom, 1) + MOVE_CURSOR_DOWN_B
+        )
+        self._rowMoves = [moveCursorBytes(top + row, 1) for row in range(self.rows)]
 
-        def spaceLeft() -> int:
-            nonlocal curLine
+        # What we last drew on each row of our viewport. We're handed an already cleared
+        # viewport, which is the same thing that drawing an empty line leaves behind.
+        self._shadow: List[Optional[bytes]] = [CLEAR_TO_END_OF_LINE_B] * self.rows
 
-            return self.terminal.columns - len(curLine)
+    def wordWrap(self, text: str) -> List[str]:
+        # Make things easier to deal with.
+        text = text.replace("\r\n", "\n")
 
-        while text:
-            if len(text) <= spaceLeft():
+        # Rather than repeatedly chopping consumed text off the front and appending to
+        # the output, we walk the text with an index and collect slices of the current line
+        # along with its running length, joining each line once when it's done.
+        columns = self.terminal.columns
+        lines: List[str] = []
+        endedNewline = True
+        lineParts: List[str] = []
+        colUsed = 0
+        pos = 0
+        end = len(text)
+
+        # The next newline and space at or after our position, or the end of the text if
+        # there are no more. These are only searched for again once we move past them.
+        newlinePos = -1
+        spacePos = -1
+
+        while pos < end:
+            if (end - pos) <= (columns - colUsed):
                 # Just append the end.
-                curLine += text
-                text = ""
+                lineParts.append(text[pos:])
+                colUsed += end - pos
+                pos = end
             else:
                 # First, if there's a newline somewhere, see if it falls within this line.
                 # if so, then just add everything up to and including it and move on.
-                newlinePos = text.find("\n")
-                if newlinePos >= 0:
-                    chunkLen = newlinePos + 1
-
-                    # We intentionally allow the newline to trail off because we don't auto-wrap,
-                    # so it's okay to "print" it at the end since the next word will be on the
-                    # new line anyway.
-                    if chunkLen <= (spaceLeft() + 1):
-                        curLine += text[:chunkLen]
-                        text = text[chunkLen:]
-                        joinLines()
+                if newlinePos < pos:
+                    newlinePos = text.find("\n", pos)
+                    if newlinePos < 0:
+                        newlinePos = end
+                chunkLen = (newlinePos - pos) + 1
+
+                # We intentionally allow the newline to trail off because we don't auto-wrap,
+                # so it's okay to "print" it at the end since the next word will be on the
+                # new line anyway.
+                if newlinePos < end and chunkLen <= (columns - colUsed + 1):
+                    lineParts.append(text[pos : (pos + chunkLen)])
+                    pos += chunkLen
+                else:
+                    # If we get here, our closest newline is on the next line somewhere (or beyond), or
+                    # does not exist. So we need to find the first space character to determine that
+                    # word's length.
+                    if spacePos < pos:
+                        spacePos = text.find(" ", pos)
+                        if spacePos < 0:
+                            # If we don't find a space, treat the entire rest of the text as a single word.
+                            spacePos = end
+                    nextIsSpace = spacePos < end
+                    wordLen = spacePos - pos
+                    spaceLeft = columns - colUsed
+
+                    if wordLen < spaceLeft:
+                        # We have enough room to add the word AND the space.
+                        if nextIsSpace:
+                            lineParts.append(text[pos : (spacePos + 1)])
+                            colUsed += wordLen + 1
+                            pos = spacePos + 1
+                        else:
+                            lineParts.append(text[pos:spacePos])
+                            colUsed += wordLen
+                            pos = spacePos
                         continue
-
-                # If we get here, our closest newline is on the next line somewhere (or beyond), or
-                # does not exist. So we need to find the first space character to determine that
-                # word's length.
-                spacePos = text.find(" ")
-                nextIsSpace = True
-                if spacePos < 0:
-                    # If we don't find a space, treat the entire rest of the text as a single word.
-                    spacePos = len(text)
-                    nextIsSpace = False
-
-                if spacePos < spaceLeft():
-                    # We have enough room to add the word AND the space.
-                    if nextIsSpace:
-                        curLine += text[: (spacePos + 1)]
-                        text = text[(spacePos + 1) :]
-                    else:
-                        curLine += text[:spacePos]
-                        text = text[spacePos:]
-                elif spacePos == spaceLeft():
-                    # We have enough room for the word but not the space, so add a newline instead.
-                    if nextIsSpace:
-                        curLine += text[:spacePos] + "\n"
-                        text = text[(spacePos + 1) :]
-                    else:
-                        curLine += text[:spacePos]
-                        text = text[spacePos:]
+                    elif wordLen == spaceLeft:
+                        # We have enough room for the word but not the space, so add a newline instead.
+                        lineParts.append(text[pos:spacePos])
+                        colUsed += wordLen
+                        if nextIsSpace:
+                            lineParts.append("\n")
+                            colUsed += 1
+                            pos = spacePos + 1
+                        else:
+                            pos = spacePos
+                        continue
+                    elif not lineParts:
+                        # We can't fit this, and the current line is empty, so this word is longer
+                        # than wrappable. In that case, split it with a newline at the wrap point.
+                        lineParts.append(text[pos : (pos + spaceLeft)])
+                        pos += spaceLeft
+
+                # Either the line ended in a newline or we can't fit anything else on it, so
+                # finish it off and leave the rest for the next line. A line that ends in a
+                # newline doesn't need another one to separate it from the next, and wrapping
+                # can leave newlines in the middle of a line too.
+                line = "".join(lineParts)
+                endedNewline = line[-1] == "\n"
+                if endedNewline:
+                    line = line[:-1]
+                if "\n" in line:
+                    lines.extend(line.split("\n"))
                 else:
-                    # We can't fit this, leave it for the next line if possible. However, if the
-                    # current line is empty, that means this word is longer than wrappable. In
-                    # that case, split it with a newline at the wrap point.
-                    if curLine:
-                        joinLines()
-                    else:
-                        width = spaceLeft()
-                        curLine += text[:width]
-                        text = text[width:]
-                        joinLines()
+                    lines.append(line)
+                lineParts.clear()
+                colUsed = 0
 
         # Join the final line.
-        joinLines()
-        return newText
+        if lineParts:
+            line = "".join(lineParts)
+            endedNewline = line[-1] == "\n"
+            if endedNewline:
+                line = line[:-1]
+            if "\n" in line:
+                lines.extend(line.split("\n"))
+            else:
+                lines.append(line)
+
+        # Trailing newlines (or no text at all) leave an empty line at the end.
+        if endedNewline:
+            lines.append("")
+        return lines
 
     def displayText(self, text: str, forceRefresh: bool = False) -> None:
         # First, we need to wordwrap the text based on the terminal's width.
-        text = self.wordWrap(text)
-        self.text = text.split("\n")
+        columns = self.terminal.columns
+        if TextRendererCore._wrapCacheText != text:
+            TextRendererCore._wrapCacheText = text
+            TextRendererCore._wrapCache = {}
+
+        cache = TextRendererCore._wrapCache.get(columns)
+        if cache is not None:
+            self.text, self.runs, self.rendered = cache
+        else:
+            self.text = self.wordWrap(text)
+            self.runs = self._parseLinks(self.text)
+
+            # The terminal width is fixed for as long as we're connected, so every line
+            # will always render to the same bytes. Do that once here rather than on
+            # every scroll.
+            self.rendered = self._renderLines(0, len(self.text))
+            TextRendererCore._wrapCache[columns] = (self.text, self.runs, self.rendered)
 
-        # Control our scroll region, only erase the text we want.
-        self.terminal.moveCursor(self.top, 1)
-        self.terminal.setScrollRegion(self.top, self.bottom)
+        # The furthest down we can scroll while still filling the viewport.
+        self.lastLine = max(len(self.text) - self.rows, 0)
 
         # Display the visible chunk of text. For an initial draw, we're good
         # relying on our parent renderer to have cleared the viewport.
+        if forceRefresh:
+            self._shadow = [None] * self.rows
         self.line = 0
-        self._displayText(self.line, self.line + self.rows, forceRefresh)
+        self._displayText(0, self.rows)
+        self._flush()
 
-        # No longer need scroll region protection.
-        self.terminal.clearScrollRegion()
+    def markViewportCleared(self) -> None:
+        # Our parent wiped the screen out from under us, so forget what we drew.
+        self._shadow = [CLEAR_TO_END_OF_LINE_B] * self.rows
 
     def scrollUp(self) -> None:
-        if self.line > 0:
-            self.line -= 1
-
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.moveCursor(self.top, 1)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self.terminal.sendCommand(Terminal.MOVE_CURSOR_UP)
-            self._displayText(self.line, self.line + 1, False)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        self._redraw(self.line - 1)
 
     def scrollDown(self) -> None:
-        if self.line < (len(self.text) - self.rows):
-            self.line += 1
-
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self.terminal.moveCursor((self.bottom - self.top) + 1, 1)
-            self.terminal.sendCommand(Terminal.MOVE_CURSOR_DOWN)
-            self._displayText(self.line + (self.rows - 1), self.line + self.rows, False)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        self._redraw(self.line + 1)
+
+    def scrollBy(self, lines: int) -> None:
+        self._redraw(self.line + lines)
 
     def boundsEnforce(self, line: int) -> int:
-        if line > (len(self.text) - self.rows):
-            line = len(self.text) - self.rows
+        if line > self.lastLine:
+            line = self.lastLine
         if line < 0:
             line = 0
         return line
 
     def pageUp(self) -> None:
-        line = self.boundsEnforce(self.line - (self.rows - 1))
-        if line != self.line:
-            self.line = line
-
-            # Gotta redraw the whole thing.
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.moveCursor(self.top, 1)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self._displayText(self.line, self.line + self.rows, True)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        self._redraw(self.line - (self.rows - 1))
 
     def pageDown(self) -> None:
-        line = self.boundsEnforce(self.line + (self.rows - 1))
-        if line != self.line:
-            self.line = line
-
-            # Gotta redraw the whole thing.
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.moveCursor(self.top, 1)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self._displayText(self.line, self.line + self.rows, True)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        self._redraw(self.line + (self.rows - 1))
 
     def goToTop(self) -> None:
-        line = self.boundsEnforce(0)
-        if line != self.line:
-            self.line = line
-
-            # Gotta redraw the whole thing.
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.moveCursor(self.top, 1)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self._displayText(self.line, self.line + self.rows, True)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        self._redraw(0)
 
     def goToBottom(self) -> None:
-        line = self.boundsEnforce(len(self.text) - self.rows)
-        if line != self.line:
-            self.line = line
-
-            # Gotta redraw the whole thing.
-            self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-            self.terminal.sendCommand(Terminal.SET_NORMAL)
-            self.terminal.moveCursor(self.top, 1)
-            self.terminal.setScrollRegion(self.top, self.bottom)
-            self._displayText(self.line, self.line + self.rows, True)
-            self.terminal.clearScrollRegion()
-            self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
-
-    def _displayText(
-        self, startVisible: int, endVisible: int, wipeNonText: bool
-    ) -> None:
-        bolded = False
-        boldRequested = False
-
-        def sendText(text: str) -> None:
-            nonlocal bolded
-            nonlocal boldRequested
-
-            if bolded != boldRequested:
-                bolded = boldRequested
-                if bolded:
-                    self.terminal.sendCommand(Terminal.SET_BOLD)
-                else:
-                    self.terminal.sendCommand(Terminal.SET_NORMAL)
+        self._redraw(self.lastLine)
+
+    def _emit(self, data: bytes) -> None:
+        self._outbuf += data
+
+    def _flush(self) -> None:
+        # Send everything we've rendered so far to the terminal in one write.
+        if self._outbuf:
+            sendRaw(self.terminal, bytes(self._outbuf))
+            self._outbuf.clear()
 
-            self.terminal.sendText(text)
+    def _redraw(self, line: int) -> None:
+        line = self.boundsEnforce(line)
+        delta = line - self.line
+        if not delta:
+            return
+        self.line = line
+
+        # If some of what's on screen is still visible, let the terminal shift it into
+        # place within our scroll region so only the newly revealed rows get drawn. This
+        # leaves the cursor at the start of the top or bottom row, depending on direction.
+        startRow = 0
+        endRow = self.rows
+        if 0 < delta < self.rows:
+            self._emit(self._scrollDownB)
+            self._emit(MOVE_CURSOR_DOWN_B * (delta - 1))
+            startRow = self.rows - delta
+            cursorRow = self.rows - 1
+            finish = CLEAR_SCROLL_REGION_RESTORE_CURSOR_B
+
+            del self._shadow[:delta]
+            self._shadow.extend([CLEAR_TO_END_OF_LINE_B] * delta)
+        elif 0 < -delta < self.rows:
+            self._emit(self._scrollUpB)
+            self._emit(MOVE_CURSOR_UP_B * (-delta - 1))
+            endRow = -delta
+            cursorRow = 0
+            finish = CLEAR_SCROLL_REGION_RESTORE_CURSOR_B
+
+            self._shadow[:0] = [CLEAR_TO_END_OF_LINE_B] * -delta
+            del self._shadow[self.rows :]
+        else:
+            self._emit(SAVE_CURSOR_NORMAL_B)
+            cursorRow = -1
+            finish = RESTORE_CURSOR_B
+
+        # Redraw whatever lines changed.
+        self._displayText(startRow, endRow, cursorRow)
+        self._emit(finish)
+        self._flush()
+
+    def _displayText(self, startRow: int, endRow: int, cursorRow: int = -1) -> None:
+        # Only redraw the lines that differ from what's already on the screen, out of
+        # the rows that could have. If we know the cursor is already at the start of a
+        # row, we don't need to move it there.
+        lastRow = -2
+        for row, data in enumerate(self._renderFrame(startRow, endRow), startRow):
+            if data == self._shadow[row]:
+                continue
 
-        def setBold(bold: bool) -> None:
-            nonlocal boldRequested
-            boldRequested = bold
+            if row == lastRow + 1:
+                # Cheaper than positioning the cursor, and we're never on the last row.
+                self._emit(NEWLINE_B)
+            elif row != cursorRow:
+                self._emit(self._rowMoves[row])
+
+            if self._shadow[row] == CLEAR_TO_END_OF_LINE_B:
+                # This row is already blank.
+                self._emit(stripClear(data))
+            else:
+                self._emit(data)
+
+            self._shadow[row] = data
+            lastRow = row
+            cursorRow = -1
+
+    def _renderFrame(self, startRow: int, endRow: int) -> List[bytes]:
+        frame = self.rendered[(self.line + startRow) : (self.line + endRow)]
+
+        # Anything past the end of the text is blank.
+        while len(frame) < (endRow - startRow):
+            frame.append(CLEAR_TO_END_OF_LINE_B)
+
+        return frame
+
+    def _renderLines(self, startVisible: int, endVisible: int) -> List[bytes]:
+        # Render each requested line to its own chunk of output, so that any line can be
+        # drawn on its own. Every line starts and ends with normal text attributes and
+        # clears out anything that was previously drawn after it.
+        frame: List[bytes] = []
+        columns = self.terminal.columns
+        for line in range(startVisible, min(endVisible, len(self.text))):
+            parts: List[bytes] = []
+            bolded = False
+            for bold, text in self.runs[line]:
+                if bolded != bold:
+                    bolded = bold
+                    parts.append(SET_BOLD_B if bolded else SET_NORMAL_B)
+                parts.append(text.encode("ascii", "replace"))
+
+            if bolded:
+                parts.append(SET_NORMAL_B)
+            if len(self.text[line]) < columns:
+                parts.append(CLEAR_TO_END_OF_LINE_B)
+
+            frame.append(b"".join(parts))
+
+        return frame
+
+    def _parseLinks(self, lines: List[str]) -> List[List[Tuple[bool, str]]]:
+        # Split each line up into runs of text which are either bolded or not, based on
+        # where links start and end. Links can span lines, so this has to be done for
+        # the whole text at once, but it only needs to be done when the text changes.
+        # Text is collected up as slices, and only joined into a run when bolding flips
+        # (which it always does when it's set, since we're bold exactly when inside a link)
+        # or the line ends.
+        runs: List[List[Tuple[bool, str]]] = []
+        bold = False
 
-        displayed = 0
-        line = 0
         linkDepth = 0
-        lastLine = min(self.rows + self.line, len(self.text), endVisible)
-        while line < lastLine:
-            # Grab the text itself, add a newline if we aren't the last line (don't want to scroll).
-            text = self.text[line]
-            needsClear = wipeNonText and (len(text) < self.terminal.columns)
-            line += 1
-
-            while text:
-                openLinkPos = text.find("[")
-                closeLinkPos = text.find("]")
-
-                if openLinkPos < 0 and closeLinkPos < 0:
+        for text in lines:
+            lineRuns: List[Tuple[bool, str]] = []
+            parts: List[str] = []
+
+            # Walk each line with an index rather than splitting pieces off of it. Much like
+            # in wordWrap, the next link markers are only searched for again once we move
+            # past them, and are the end of the line if there are no more.
+            pos = 0
+            end = len(text)
+            openLinkPos = -1
+            closeLinkPos = -1
+
+            while pos < end:
+                if openLinkPos < pos:
+                    openLinkPos = text.find("[", pos)
+                    if openLinkPos < 0:
+                        openLinkPos = end
+                if closeLinkPos < pos:
+                    closeLinkPos = text.find("]", pos)
+                    if closeLinkPos < 0:
+                        closeLinkPos = end
+
+                if openLinkPos == end and closeLinkPos == end:
                     # No links in this line.
-                    if line > startVisible:
-                        sendText(text)
-                    text = ""
-                elif openLinkPos >= 0 and closeLinkPos < 0:
+                    parts.append(text[pos:])
+                    pos = end
+                elif closeLinkPos == end:
                     # Started a link in this line, but didn't end it.
                     linkDepth += 1
-                    before, text = text.split("[", 1)
 
-                    if line > startVisible:
-                        sendText(before)
+                    parts.append(text[pos:openLinkPos])
                     if linkDepth == 1:
                         # Only bold on the outermost link marker.
-                        setBold(True)
-                    if line > startVisible:
-                        sendText("[")
-                elif (openLinkPos < 0 and closeLinkPos >= 0) or (
-                    closeLinkPos < openLinkPos
-                ):
+                        run = "".join(parts)
+                        if run:
+                            lineRuns.append((bold, run))
+                            parts = []
+                        elif lineRuns:
+                            # Nothing between this link and the last, so keep adding to it.
+                            parts = [lineRuns.pop()[1]]
+                        bold = True
+                    parts.append("[")
+                    pos = openLinkPos + 1
+                elif closeLinkPos < openLinkPos:
                     # Finished a link on in this line, but there's no second start or
                     # the second start comes later.
-                    after, text = text.split("]", 1)
-
-                    if line > startVisible:
-                        sendText(after)
-                        sendText("]")
+                    parts.append(text[pos:closeLinkPos])
+                    parts.append("]")
                     if linkDepth == 1:
-                        setBold(False)
+                        lineRuns.append((bold, "".join(parts)))
+                        parts = []
+                        bold = False
 
                     linkDepth -= 1
+                    pos = closeLinkPos + 1
                 else:
                     # There's an open and close on this line. Simply highlight it as-is. No need
                     # to handle incrementing/decrementing the depth.
-                    before, text = text.split("[", 1)
-
-                    if line > startVisible:
-                        sendText(before)
+                    parts.append(text[pos:openLinkPos])
                     if linkDepth == 0:
                         # Only bold on the outermost link marker.
-                        setBold(True)
-                    if line > startVisible:
-                        sendText("[")
-
-                    after, text = text.split("]", 1)
-
-                    if line > startVisible:
-                        sendText(after)
-                        sendText("]")
+                        run = "".join(parts)
+                        if run:
+                            lineRuns.append((bold, run))
+                            parts = []
+                        elif lineRuns:
+                            # Nothing between this link and the last, so keep adding to it.
+                            parts = [lineRuns.pop()[1]]
+                        bold = True
+                    parts.append("[")
+
+                    parts.append(text[(openLinkPos + 1) : closeLinkPos])
+                    parts.append("]")
                     if linkDepth == 0:
-                        setBold(False)
-
-            if line > startVisible:
-                displayed += 1
+                        lineRuns.append((bold, "".join(parts)))
+                        parts = []
+                        bold = False
+                    pos = closeLinkPos + 1
 
-                if needsClear:
-                    self.terminal.sendCommand(Terminal.CLEAR_TO_END_OF_LINE)
+            run = "".join(parts)
+            if run:
+                lineRuns.append((bold, run))
+            runs.append(lineRuns)
 
-                if line != endVisible:
-                    self.terminal.sendText("\n")
+        return runs
 
-        if wipeNonText:
-            clearAmount = endVisible - startVisible
-            while displayed < clearAmount:
-                self.terminal.sendCommand(Terminal.CLEAR_LINE)
 
-                if displayed < (self.rows - 1):
-                    self.terminal.sendText("\n")
+# Matches a "$" in a command along with whatever it applies to. That's either an escaped
+# "$$", the "$*" parameter, a numbered parameter (which swallows the character after it)
+# or a lone "$" (which swallows the character after it as well).
+PARAM_RE = re.compile(r"\$(?:(\*)|\$|([0-9]+)(?:.|\Z)|.|\Z)", re.DOTALL)
 
-                displayed += 1
+# Matches an escaped "$$", or a lone "$" at the very end of a command.
+UNESCAPE_RE = re.compile(r"\$(\$|\Z)")
 
 
 class Entry:
@@ -381,68 +562,32 @@ class Entry:
         self.__cmd = cmd
         self.__params: Dict[str, str] = params
 
+        # The command never changes, so figure out everything we need from it once.
+        self.__unescapedCmd = UNESCAPE_RE.sub(r"\1", cmd)
+        self.__foundParams = self.__findParams()
+        self.__paramsSuffix = self.__formatParams()
+
     @property
     def cmd(self) -> str:
-        # Unescape $$.
-        out = ""
-        state = "normal"
-        for ch in self.__cmd:
-            if state == "normal":
-                if ch == "$":
-                    # Next one might be a $ as well, so we unescape.
-                    state = "accumulate"
-                else:
-                    # Not interesting, just accumulate.
-                    out += ch
-            elif state == "accumulate":
-                if ch == "$":
-                    # Two $$s in a row, output a single one.
-                    out += ch
-                    state = "normal"
-                else:
-                    # One $ and anything else, output that $ and the anything else.
-                    out += "$" + ch
-                    state = "normal"
-
-        return out
+        return self.__unescapedCmd
 
     @property
     def params(self) -> Dict[str, str]:
+        return self.__foundParams
+
+    @property
+    def formattedParamsSuffix(self) -> str:
+        return self.__paramsSuffix
+
+    def __findParams(self) -> Dict[str, str]:
         # Figure out params in the command.
         seen: List[str] = []
-
-        state = "normal"
-        accumed = ""
-        for ch in self.__cmd:
-            if state == "normal":
-                if ch == "$":
-                    # We need to accumulate numbers or a "*"
-                    state = "accumulate"
-            elif state == "accumulate":
-                if ch == "$" and (not accumed):
-                    # This is just escaped, ignore it.
-                    state = "normal"
-                elif ch == "*" and (not accumed):
-                    # This is a "$*" for all params.
-                    seen.append("$*")
-                    accumed = ""
-                    state = "normal"
-                elif ch in "1234567890":
-                    # This should be accumulated.
-                    accumed += ch
-                else:
-                    # This is done, go back to normal. We add a special case for if
-                    # we didn't accumulate anything, so shell scripts can use syntax
-                    # similar to ${ENV} without escaping the dollar sign.
-                    if accumed:
-                        seen.append("$" + accumed)
-                    accumed = ""
-                    state = "normal"
-
-        if accumed:
-            # Ran off the end.
-            seen.append("$" + accumed)
-            accumed = ""
+        for match in PARAM_RE.finditer(self.__cmd):
+            if match.group(1):
+                # This is a "$*" for all params.
+                seen.append("$*")
+            elif match.group(2):
+                seen.append("$" + match.group(2))
 
         # Return them, with their names if available.
         out: Dict[str, str] = {}
@@ -461,160 +606,230 @@ class Entry:
 
         return out
 
+    def __formatParams(self) -> str:
+        # Figure out how the params are displayed after the menu option, in order.
+        if not self.__foundParams:
+            return ""
+
+        def key(param: str) -> int:
+            param = param[1:]
+            try:
+                return int(param)
+            except ValueError:
+                return 0xFFFFFFFF
+
+        params = [f"<{self.__foundParams[p]}>" for p in sorted(self.__foundParams, key=key)]
+        return " " + " ".join(params)
+
+
+# Characters that can't show up in a parameter, since they'd let it escape the command.
+INVALID_CHARS = frozenset(";<>()|&")
+
 
 def invalidChars(param: str) -> bool:
-    for ch in ";<>()|&":
-        if ch in param:
-            return True
-    return False
+    return not INVALID_CHARS.isdisjoint(param)
 
 
 class Renderer:
-    def __init__(self, terminal: Terminal) -> None:
+    def __init__(self, terminal: Terminal, insertDelete: bool = False) -> None:
         self.terminal = terminal
+        self.insertDelete = insertDelete
         self.input = ""
         self.cursorPos = 1
         self.options: List[Entry] = []
+        self.title = ""
+        self.text = ""
         self.lastError = ""
-        self.renderer = RendererCore(terminal, 3, self.terminal.rows - 2)
-
-    def displayMenu(self, title: str, settings: List[Entry]) -> None:
+        self.renderer = TextRendererCore(terminal, 3, self.terminal.rows - 2)
+
+        # Special keys we know how to handle on their own.
+        self._keyHandlers: Dict[bytes, Callable[[int], None]] = {
+            Terminal.LEFT: self._onLeft,
+            Terminal.RIGHT: self._onRight,
+            Terminal.UP: self._onUp,
+            Terminal.DOWN: self._onDown,
+            Terminal.BACKSPACE: self._onBackspace,
+            Terminal.DELETE: self._onBackspace,
+            # Ignore this, we act on the newline.
+            b"\r": self._onIgnore,
+        }
+
+        # Errors always go on the line above input, so build what comes before them up front.
+        # Clearing one doesn't draw any text, so it doesn't need to touch attributes at all.
+        errorLine = SAVE_CURSOR_B + moveCursorBytes(self.terminal.rows - 1, 1) + CLEAR_LINE_B
+        self._errorPrefix = errorLine + SET_NORMAL_BOLD_B
+        self._clearErrorB = errorLine + RESTORE_CURSOR_B
+
+        # Blank input lines, by terminal width since that can be switched between.
+        self._clearInputB: Dict[int, bytes] = {}
+
+    def displayMenu(self, title: str, text: str, options: List[Entry]) -> None:
         # Render status bar at the bottom.
         self.clearInput()
 
-        # First, wipe the screen and display the title.
-        self.terminal.moveCursor(self.terminal.rows - 2, 1)
-        self.terminal.sendCommand(Terminal.CLEAR_LINE)
-        self.terminal.sendCommand(Terminal.CLEAR_TO_ORIGIN)
-        self.terminal.sendCommand(Terminal.MOVE_CURSOR_ORIGIN)
-
-        # Reset text display and put title up.
-        self.terminal.setAutoWrap()
-        self.terminal.sendCommand(Terminal.SET_NORMAL)
-        self.terminal.sendCommand(Terminal.SET_BOLD)
-        self.terminal.sendText(title)
-        self.terminal.sendCommand(Terminal.SET_NORMAL)
-        self.terminal.clearAutoWrap()
+        sendRaw(
+            self.terminal,
+            # First, wipe the screen and display the title.
+            moveCursorBytes(self.terminal.rows - 2, 1)
+            + CLEAR_LINE_B
+            + CLEAR_TO_ORIGIN_B
+            + MOVE_CURSOR_ORIGIN_B
+            # Reset text display and put title up.
+            + SET_AUTO_WRAP_B
+            + SET_NORMAL_BOLD_B
+            + title.encode("ascii", "replace")
+            + SET_NORMAL_B
+            + CLEAR_AUTO_WRAP_B,
+        )
 
         # Render out the text of the page.
-        entries: List[str] = []
-        options: List[Entry] = []
-        for index, entry in enumerate(settings):
-            if entry.params:
-                def key(param: str) -> int:
-                    param = param[1:]
-                    try:
-                        return int(param)
-                    except ValueError:
-                        return 0xFFFFFFFF
-
-                params = [f"<{entry.params[p]}>" for p in sorted(entry.params, key=key)]
-                entries.append(f"[!{index + 1} {' '.join(params)}] {entry.title}")
-            else:
-                entries.append(f"[!{index + 1}] {entry.title}")
-            options.append(entry)
+        self.title = title
+        self.text = text
         self.options = options
-
-        text = (
-            'The following programs are available. To run, type "!" followed '
-            + "by the selection number and press enter.\n\n"
-            + "\n".join(entries)
-        )
-        self.renderer = TextRendererCore(self.terminal, 3, self.terminal.rows - 2)
+        self.renderer.markViewportCleared()
         self.renderer.displayText(text)
 
         # Move cursor to where we expect it for input.
         self.terminal.moveCursor(self.terminal.rows, 1)
 
+    def redisplayMenu(self) -> None:
+        # Everything about the menu is already built, we just need to draw it again.
+        self.displayMenu(self.title, self.text, self.options)
+
     def clearInput(self) -> None:
         # Clear error display.
         self.clearError()
 
-        self.terminal.moveCursor(self.terminal.rows, 1)
-        self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-        self.terminal.sendCommand(Terminal.SET_NORMAL)
-        self.terminal.sendCommand(Terminal.SET_REVERSE)
-        self.terminal.sendText(" " * self.terminal.columns)
-        self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        columns = self.terminal.columns
+        data = self._clearInputB.get(columns)
+        if data is None:
+            data = (
+                moveCursorBytes(self.terminal.rows, 1)
+                + SAVE_CURSOR_B
+                + SET_NORMAL_REVERSE_B
+                + b" " * columns
+                + RESTORE_CURSOR_B
+            )
+            self._clearInputB[columns] = data
+        sendRaw(self.terminal, data)
 
         # Clear command.
         self.input = ""
         self.cursorPos = 1
 
     def clearError(self) -> None:
-        self.displayError("")
+        if self.lastError:
+            self.displayError("")
 
     def displayError(self, error: str) -> None:
         if error == self.lastError:
             return
 
-        self.terminal.sendCommand(Terminal.SAVE_CURSOR)
-        self.terminal.moveCursor(self.terminal.rows - 1, 1)
-        self.terminal.sendCommand(Terminal.CLEAR_LINE)
-        self.terminal.sendCommand(Terminal.SET_NORMAL)
-        self.terminal.sendCommand(Terminal.SET_BOLD)
-        self.terminal.sendText(error)
-        self.terminal.sendCommand(Terminal.SET_NORMAL)
-        self.terminal.sendCommand(Terminal.RESTORE_CURSOR)
+        if error:
+            sendRaw(
+                self.terminal,
+                self._errorPrefix + error.encode("ascii", "replace") + SET_NORMAL_RESTORE_CURSOR_B,
+            )
+        else:
+            sendRaw(self.terminal, self._clearErrorB)
         self.lastError = error
 
-    def processInput(self, inputVal: bytes) -> Optional[Action]:
-        row, _ = self.terminal.fetchCursor()
-        if inputVal == Terminal.LEFT:
-            if self.cursorPos > 1:
+    def _onLeft(self, row: int) -> None:
+        if self.cursorPos > 1:
+            self.cursorPos -= 1
+            self.terminal.moveCursor(row, self.cursorPos)
+
+    def _onRight(self, row: int) -> None:
+        if self.cursorPos < (len(self.input) + 1):
+            self.cursorPos += 1
+            self.terminal.moveCursor(row, self.cursorPos)
+
+    def _onUp(self, row: int) -> None:
+        self.renderer.scrollUp()
+
+    def _onDown(self, row: int) -> None:
+        self.renderer.scrollDown()
+
+    def _onBackspace(self, row: int) -> None:
+        if self.input:
+            # Just subtract from input.
+            if self.cursorPos == len(self.input) + 1:
+                # Erasing at the end of the line.
+                self.input = self.input[:-1]
+
                 self.cursorPos -= 1
-                self.terminal.moveCursor(row, self.cursorPos)
-        elif inputVal == Terminal.RIGHT:
-            if self.cursorPos < (len(self.input) + 1):
-                self.cursorPos += 1
-                self.terminal.moveCursor(row, self.cursorPos)
-        elif inputVal == Terminal.UP:
-            self.renderer.scrollUp()
-        elif inputVal == Terminal.DOWN:
-            self.renderer.scrollDown()
-        elif inputVal in {Terminal.BACKSPACE, Terminal.DELETE}:
-            if self.input:
-                # Just subtract from input.
-                if self.cursorPos == len(self.input) + 1:
-                    # Erasing at the end of the line.
-                    self.input = self.input[:-1]
-
-                    self.cursorPos -= 1
-                    self.terminal.moveCursor(row, self.cursorPos)
-                    self.terminal.sendCommand(Terminal.SET_NORMAL)
-                    self.terminal.sendCommand(Terminal.SET_REVERSE)
-                    self.terminal.sendText(" ")
-                    self.terminal.moveCursor(row, self.cursorPos)
-                elif self.cursorPos == 1:
-                    # Erasing at the beginning, do nothing.
-                    pass
-                elif self.cursorPos == 2:
-                    # Erasing at the beginning of the line.
-                    self.input = self.input[1:]
-
-                    self.cursorPos -= 1
-                    self.terminal.moveCursor(row, self.cursorPos)
-                    self.terminal.sendCommand(Terminal.SET_NORMAL)
-                    self.terminal.sendCommand(Terminal.SET_REVERSE)
-                    self.terminal.sendText(self.input)
-                    self.terminal.sendText(" ")
-                    self.terminal.moveCursor(row, self.cursorPos)
-                else:
-                    # Erasing in the middle of the line.
-                    spot = self.cursorPos - 2
-                    self.input = self.input[:spot] + self.input[(spot + 1) :]
-
-                    self.cursorPos -= 1
-                    self.terminal.moveCursor(row, self.cursorPos)
-                    self.terminal.sendCommand(Terminal.SET_NORMAL)
-                    self.terminal.sendCommand(Terminal.SET_REVERSE)
-                    self.terminal.sendText(self.input[spot:])
-                    self.terminal.sendText(" ")
-                    self.terminal.moveCursor(row, self.cursorPos)
-        elif inputVal == b"\r":
-            # Ignore this.
-            pass
-        elif inputVal == b"\n":
+                sendRaw(
+                    self.terminal,
+                    moveCursorBytes(row, self.cursorPos)
+                    + SET_NORMAL_REVERSE_B
+                    + b" "
+                    + moveCursorBytes(row, self.cursorPos),
+                )
+            elif self.cursorPos == 1:
+                # Erasing at the beginning, do nothing.
+                pass
+            elif self.insertDelete:
+                # Erasing anywhere else, let the terminal shift the rest of the input over.
+                spot = self.cursorPos - 2
+                self.input = self.input[:spot] + self.input[(spot + 1) :]
+
+                self.cursorPos -= 1
+                sendRaw(
+                    self.terminal,
+                    moveCursorBytes(row, self.cursorPos)
+                    + deleteCharactersBytes(1)
+                    # The blank shifted in at the end of the line isn't reverse video, so fix it.
+                    + SAVE_CURSOR_B
+                    + moveCursorBytes(row, self.terminal.columns)
+                    + SET_NORMAL_REVERSE_B
+                    + b" "
+                    + RESTORE_CURSOR_B,
+                )
+            elif self.cursorPos == 2:
+                # Erasing at the beginning of the line.
+                self.input = self.input[1:]
+
+                self.cursorPos -= 1
+                sendRaw(
+                    self.terminal,
+                    moveCursorBytes(row, self.cursorPos)
+                    + SET_NORMAL_REVERSE_B
+                    + self.input.encode("ascii")
+                    + b" "
+                    + moveCursorBytes(row, self.cursorPos),
+                )
+            else:
+                # Erasing in the middle of the line.
+                spot = self.cursorPos - 2
+                self.input = self.input[:spot] + self.input[(spot + 1) :]
+
+                self.cursorPos -= 1
+                sendRaw(
+                    self.terminal,
+                    moveCursorBytes(row, self.cursorPos)
+                    + SET_NORMAL_REVERSE_B
+                    + self.input[spot:].encode("ascii")
+                    + b" "
+                    + moveCursorBytes(row, self.cursorPos),
+                )
+
+    def _onIgnore(self, row: int) -> None:
+        pass
+
+    def scroll(self, lines: int) -> None:
+        self.renderer.scrollBy(lines)
+
+    def processInput(self, inputVal: bytes) -> Optional[Action]:
+        # Input always lives on the last row, so there's no need to ask the terminal where we are.
+        row = self.terminal.rows
+
+        # Editing and navigation keys, which never produce an action.
+        handler = self._keyHandlers.get(inputVal)
+        if handler is not None:
+            handler(row)
+            return None
+
+        if inputVal == b"\n":
             # Execute command.
             actual = self.input.strip()
             if not actual:
@@ -697,7 +912,7 @@ class Renderer:
         else:
             if len(self.input) < (self.terminal.columns - 1):
                 # If we got some unprintable character, ignore it.
-                inputVal = bytes(v for v in inputVal if v >= 0x20)
+                inputVal = inputVal.translate(None, UNPRINTABLE_B)
                 if inputVal:
                     # Just add to input.
                     char = inputVal.decode("ascii")
@@ -705,30 +920,107 @@ class Renderer:
                     if self.cursorPos == len(self.input) + 1:
                         # Just appending to the input.
                         self.input += char
-                        self.terminal.sendCommand(Terminal.SET_NORMAL)
-                        self.terminal.sendCommand(Terminal.SET_REVERSE)
-                        self.terminal.sendText(char)
-                        self.terminal.moveCursor(row, self.cursorPos + 1)
+                        sendRaw(
+                            self.terminal,
+                            SET_NORMAL_REVERSE_B
+                            + inputVal
+                            + moveCursorBytes(row, self.cursorPos + 1),
+                        )
                         self.cursorPos += 1
+                    elif self.insertDelete:
+                        # Adding to mid-input, let the terminal shift the rest of the input over.
+                        spot = self.cursorPos - 1
+                        self.input = self.input[:spot] + char + self.input[spot:]
+
+                        sendRaw(
+                            self.terminal,
+                            SET_NORMAL_REVERSE_B
+                            + SET_INSERT_MODE_B
+                            + char.encode("ascii")
+                            + CLEAR_INSERT_MODE_B,
+                        )
+                        self.cursorPos += len(char)
                     else:
                         # Adding to mid-input.
                         spot = self.cursorPos - 1
                         self.input = self.input[:spot] + char + self.input[spot:]
 
-                        self.terminal.sendCommand(Terminal.SET_NORMAL)
-                        self.terminal.sendCommand(Terminal.SET_REVERSE)
-                        self.terminal.sendText(self.input[spot:])
-                        self.terminal.moveCursor(row, self.cursorPos + 1)
+                        sendRaw(
+                            self.terminal,
+                            SET_NORMAL_REVERSE_B
+                            + self.input[spot:].encode("ascii")
+                            + moveCursorBytes(row, self.cursorPos + 1),
+                        )
                         self.cursorPos += 1
 
         # Nothing happening here!
         return None
 
 
-def spawnTerminalAndRenderer(port: str, baudrate: int, flow: bool) -> Tuple[Terminal, Renderer]:
+# Commands made up only of these characters mean the same thing to bash as they do split on
+# whitespace, so they can be run directly without starting a shell first.
+SIMPLE_CMD_RE = re.compile(r"[A-Za-z0-9_./,:+@\- \t]+")
+
+# Words that bash treats specially at the start of a command, such as its own "time".
+BASH_RESERVED_WORDS = frozenset(
+    [
+        "case",
+        "coproc",
+        "do",
+        "done",
+        "elif",
+        "else",
+        "esac",
+        "fi",
+        "for",
+        "function",
+        "if",
+        "in",
+        "select",
+        "then",
+        "time",
+        "until",
+        "while",
+    ]
+)
+
+
+def runCommand(cmd: str) -> None:
+    if SIMPLE_CMD_RE.fullmatch(cmd):
+        argv = cmd.split()
+        if argv and argv[0] not in BASH_RESERVED_WORDS:
+            try:
+                subprocess.run(argv)
+                return
+            except OSError:
+                # Probably a shell builtin or something only on bash's path, let it figure it out.
+                pass
+
+    subprocess.run(['/bin/bash', "-c", cmd])
+
+
+def buildMenuText(settings: List[Entry]) -> str:
+    entries: List[str] = []
+    for index, entry in enumerate(settings):
+        entries.append(f"[!{index + 1}{entry.formattedParamsSuffix}] {entry.title}")
+
+    return (
+        'The following programs are available. To run, type "!" followed '
+        + "by the selection number and press enter.\n\n"
+        + "\n".join(entries)
+    )
+
+
+def spawnTerminalAndRenderer(
+    port: str, baudrate: int, flow: bool, insertDelete: bool
+) -> Tuple[Terminal, Renderer]:
     print("Attempting to contact VT-100...", end="")
     sys.stdout.flush()
 
+    # Retry quickly at first in case this was a momentary hiccup, backing off to once a
+    # second for terminals that are actually turned off or unplugged.
+    delay = 0.05
+    waited = 0.0
     while True:
         try:
             terminal = SerialTerminal(port, baudrate, flowControl=flow)
@@ -737,82 +1029,112 @@ def spawnTerminalAndRenderer(port: str, baudrate: int, flow: bool) -> Tuple[Term
             break
         except TerminalException:
             # Wait for terminal to re-awaken.
-            time.sleep(1.0)
+            time.sleep(delay)
+            waited += delay
+            delay = min(delay * 2, 1.0)
 
-            print(".", end="")
-            sys.stdout.flush()
+            # Only show progress about once a second regardless of how often we retry.
+            if waited >= 1.0:
+                waited -= 1.0
+                print(".", end="")
+                sys.stdout.flush()
 
-    return terminal, Renderer(terminal)
+    return terminal, Renderer(terminal, insertDelete)
 
 
-def main(title: str, settings: str, port: str, baudrate: int, flow: bool) -> int:
+def main(
+    title: str, settings: str, port: str, baudrate: int, flow: bool, insertDelete: bool
+) -> int:
     # Parse out options.
     cfg = configparser.ConfigParser()
     cfg.read(settings)
 
     settingsList: List[Entry] = []
     for section in cfg.sections():
-        command = "/bin/true"
-        params: Dict[str, str] = {}
-
-        for key, val in cfg.items(section):
-            if key == "cmd":
-                command = val
-            elif key.startswith("$"):
-                params[key] = val
+        entry = cfg[section]
+        params = {key: val for key, val in entry.items() if key.startswith("$")}
+        settingsList.append(Entry(section, entry.get("cmd", "/bin/true"), params))
 
-        settingsList.append(Entry(section, command, params))
+    # The menu itself never changes, so only build it once.
+    menuText = buildMenuText(settingsList)
 
     exiting = False
+
+    # The runnable command, if we have something to run.
+    cmd: Optional[str] = None
+
+    def onSelect(action: SelectAction) -> None:
+        nonlocal cmd
+
+        renderer.displayError("Loading requested program...")
+        cmd = action.executable
+
+    def onSetting(action: SettingAction) -> None:
+        if action.setting in {"cols", "columns"}:
+            if action.value not in {"80", "132"}:
+                renderer.displayError(
+                    f"Unrecognized column setting {action.value}"
+                )
+            elif action.value == "80":
+                if terminal.columns != 80:
+                    terminal.set80Columns()
+                    renderer.redisplayMenu()
+                else:
+                    renderer.clearInput()
+            elif action.value == "132":
+                if terminal.columns != 132:
+                    terminal.set132Columns()
+                    renderer.redisplayMenu()
+                else:
+                    renderer.clearInput()
+        else:
+            renderer.displayError(
+                f"Unrecognized setting {action.setting}"
+            )
+
+    def onExit(action: ExitAction) -> None:
+        nonlocal exiting
+
+        print("Got request to end session!")
+        exiting = True
+
+    # What to do for each action the renderer can hand back to us.
+    actionHandlers: Dict[Type[Action], Callable[[Any], None]] = {
+        SelectAction: onSelect,
+        SettingAction: onSetting,
+        ExitAction: onExit,
+    }
+
     while not exiting:
-        # The runnable command, if we have something to run.
-        cmd: Optional[str] = None
+        cmd = None
 
         # First, render the current page to the display.
-        terminal, renderer = spawnTerminalAndRenderer(port, baudrate, flow)
-        renderer.displayMenu(title, settingsList)
+        terminal, renderer = spawnTerminalAndRenderer(port, baudrate, flow, insertDelete)
+        renderer.displayMenu(title, menuText, settingsList)
         renderer.clearInput()
 
         try:
             while cmd is None and not exiting:
-                # Grab input, de-duplicate held down up/down presses so they don't queue up.
+                # Grab input, coalesce held down up/down presses so they don't queue up.
                 # This can cause the entire message loop to desync as we pile up requests to
-                # scroll the screen, ultimately leading in rendering issues and a crash.
+                # scroll the screen, ultimately leading in rendering issues and a crash. So,
+                # instead we scroll by however many presses are waiting with a single redraw.
                 inputVal = terminal.recvInput()
                 if inputVal in {Terminal.UP, Terminal.DOWN}:
+                    count = 1
                     while inputVal == terminal.peekInput():
                         terminal.recvInput()
+                        count += 1
+
+                    renderer.scroll(-count if inputVal == Terminal.UP else count)
+                    continue
 
                 if inputVal:
                     action = renderer.processInput(inputVal)
-                    if isinstance(action, SelectAction):
-                        renderer.displayError("Loading requested program...")
-                        cmd = action.executable
-                    elif isinstance(action, SettingAction):
-                        if action.setting in {"cols", "columns"}:
-                            if action.value not in {"80", "132"}:
-                                renderer.displayError(
-                                    f"Unrecognized column setting {action.value}"
-                                )
-                            elif action.value == "80":
-                                if terminal.columns != 80:
-                                    terminal.set80Columns()
-                                    renderer.displayMenu(title, settingsList)
-                                else:
-                                    renderer.clearInput()
-                            elif action.value == "132":
-                                if terminal.columns != 132:
-                                    terminal.set132Columns()
-                                    renderer.displayMenu(title, settingsList)
-                                else:
-                                    renderer.clearInput()
-                        else:
-                            renderer.displayError(
-                                f"Unrecognized setting {action.setting}"
-                            )
-                    elif isinstance(action, ExitAction):
-                        print("Got request to end session!")
-                        exiting = True
+                    if action is not None:
+                        handler = actionHandlers.get(type(action))
+                        if handler is not None:
+                            handler(action)
         except TerminalException:
             # Terminal went away mid-transaction.
             print("Lost terminal, will attempt a reconnect.")
@@ -823,7 +1145,7 @@ def main(title: str, settings: str, port: str, baudrate: int, flow: bool) -> int
         if cmd is not None:
             # Execute the command itself, wait for the command to finish, and then redisplay.
             del terminal
-            subprocess.run(['/bin/bash', "-c", cmd])
+            runCommand(cmd)
 
     # Restore the screen before exiting.
     terminal.reset()
@@ -851,6 +1173,11 @@ def cli() -> None:
         action="store_true",
         help="Enable software-based flow control (XON/XOFF)",
     )
+    parser.add_argument(
+        "--insert-delete",
+        action="store_true",
+        help="Use VT-102 character insert/delete when editing input, which VT-100 terminals lack",
+    )
     parser.add_argument(
         "--title",
         default="Main Menu",
@@ -867,7 +1194,16 @@ def cli() -> None:
     )
     args = parser.parse_args()
 
-    sys.exit(main(args.title, args.settings, args.port, args.baud, args.flow))
+    sys.exit(
+        main(
+            args.title,
+            args.settings,
+            args.port,
+            args.baud,
+            args.flow,
+            args.insert_delete,
+        )
+    )
 
 
 if __name__ == "__main__":